@@ -577,6 +577,7 @@ class NSort:
 
     def setup(self, keep):
         self.df = DataFrame(np.random.randn(100000, 3), columns=list("ABC"))
+        self.df["D"] = tm.makeStringIndex(100).take(np.random.randint(0, 100, 100000))
 
     def time_nlargest_one_column(self, keep):
         self.df.nlargest(100, "A", keep=keep)
@@ -590,6 +591,9 @@ class NSort:
     def time_nsmallest_two_columns(self, keep):
         self.df.nsmallest(100, ["A", "B"], keep=keep)
 
+    def time_nlargest_string_column(self, keep):
+        self.df.nlargest(100, ["D", "A"], keep=keep)
+
 
 class Describe:
     def setup(self):
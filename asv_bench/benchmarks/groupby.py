@@ -181,6 +181,53 @@ class Nth:
         self.df["values"].groupby(self.df["key"]).nth(0)
 
 
+class SelectN:
+
+    param_names = ["keep"]
+    params = ["first", "last", "all"]
+
+    def setup(self, keep):
+        N = 10 ** 6
+        self.df = DataFrame(
+            {
+                "key": np.random.randint(0, 10 ** 4, N),
+                "A": np.random.randn(N),
+                "B": np.random.randint(0, 100, N),
+            }
+        )
+
+    def time_series_nlargest(self, keep):
+        self.df.groupby("key")["A"].nlargest(5, keep=keep)
+
+    def time_series_nsmallest(self, keep):
+        self.df.groupby("key")["B"].nsmallest(5, keep=keep)
+
+    def time_frame_nlargest_two_columns(self, keep):
+        self.df.groupby("key").nlargest(5, ["B", "A"], keep=keep)
+
+
+class Approx:
+
+    param_names = ["approx"]
+    params = [False, True]
+
+    def setup(self, approx):
+        N = 10 ** 6
+        self.df = DataFrame(
+            {
+                "key": np.random.randint(0, 100, N),
+                "A": np.random.randn(N),
+                "B": np.random.randint(0, 10 ** 5, N),
+            }
+        )
+
+    def time_series_nunique(self, approx):
+        self.df.groupby("key")["B"].nunique(approx=approx)
+
+    def time_frame_quantile(self, approx):
+        self.df.groupby("key").quantile([0.1, 0.5, 0.9], approx=approx)
+
+
 class DateAttributes:
     def setup(self):
         rng = date_range("1/1/2000", "12/31/2005", freq="H")
@@ -439,6 +486,28 @@ class GroupByMethods:
         self.as_field_method()
 
 
+class CumulativeMasked:
+
+    param_names = ["dtype", "method"]
+    params = [
+        ["int64", "Int64", "boolean"],
+        ["cumsum", "cumprod", "cummin", "cummax"],
+    ]
+
+    def setup(self, dtype, method):
+        N = 10 ** 6
+        values = np.random.randint(0, 2, N)
+        if dtype == "boolean":
+            values = values.astype(bool)
+        ser = Series(values, dtype=dtype)
+        if dtype != "int64":
+            ser[::10] = None
+        self.grouped = ser.groupby(np.random.randint(0, 1000, N))
+
+    def time_cumulative(self, dtype, method):
+        getattr(self.grouped, method)()
+
+
 class RankWithTies:
     # GH 21237
     param_names = ["dtype", "tie_method"]
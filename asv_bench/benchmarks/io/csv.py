@@ -1,3 +1,4 @@
+import csv
 from io import StringIO
 import random
 import string
@@ -76,6 +77,47 @@ class ToCSVDatetimeBig(BaseIO):
         self.data.to_csv(self.fname)
 
 
+class ToCSVNumeric(BaseIO):
+
+    fname = "__test__.csv"
+    params = [None, "gzip"]
+    param_names = ["compression"]
+
+    def setup(self, compression):
+        N = 100000
+        self.df = DataFrame(
+            {
+                "float": np.random.randn(N),
+                "int": np.arange(N),
+                "bool": (np.arange(N) % 2) == 0,
+                "datetime": date_range("2000", periods=N, freq="s"),
+            }
+        )
+        self.df.loc[::10, "float"] = np.nan
+
+    def time_frame(self, compression):
+        self.df.to_csv(self.fname, compression=compression)
+
+
+class ToCSVQuoting(BaseIO):
+
+    fname = "__test__.csv"
+    params = [csv.QUOTE_MINIMAL, csv.QUOTE_NONNUMERIC]
+    param_names = ["quoting"]
+
+    def setup(self, quoting):
+        N = 100000
+        self.df = DataFrame(
+            {
+                "float": np.random.randn(N),
+                "object": np.array(["foo", "bar,baz", 'qu"ux'] * (N // 3 + 1))[:N],
+            }
+        )
+
+    def time_frame(self, quoting):
+        self.df.to_csv(self.fname, quoting=quoting)
+
+
 class StringIORewind:
     def data(self, stringio_object):
         stringio_object.seek(0)
@@ -38,6 +38,24 @@ class WriteExcel:
         writer.save()
 
 
+class WriteExcelStyled:
+    params = ["openpyxl", "xlsxwriter"]
+    param_names = ["engine"]
+
+    def setup(self, engine):
+        self.df = _generate_dataframe()
+
+    def time_write_excel_style(self, engine):
+        bio = BytesIO()
+        bio.seek(0)
+        writer = ExcelWriter(bio, engine=engine)
+        df_style = self.df.style
+        df_style.applymap(lambda x: "border: red 1px solid;")
+        df_style.applymap(lambda x: "color: blue")
+        df_style.to_excel(writer, sheet_name="Sheet1")
+        writer.save()
+
+
 class ReadExcel:
 
     params = ["xlrd", "openpyxl", "odf"]
@@ -69,5 +87,14 @@ class ReadExcel:
         fname = self.fname_odf if engine == "odf" else self.fname_excel
         read_excel(fname, engine=engine)
 
+    def time_read_excel_nrows(self, engine):
+        fname = self.fname_odf if engine == "odf" else self.fname_excel
+        read_excel(fname, engine=engine, nrows=10)
+
+    def time_read_excel_chunksize(self, engine):
+        fname = self.fname_odf if engine == "odf" else self.fname_excel
+        for chunk in read_excel(fname, engine=engine, chunksize=500):
+            pass
+
 
 from ..pandas_vb_common import setup  # noqa: F401 isort:skip
@@ -1,6 +1,6 @@
 import numpy as np
 
-from pandas import DataFrame, HDFStore, date_range, read_hdf
+from pandas import DataFrame, HDFStore, date_range, option_context, read_hdf
 
 from ..pandas_vb_common import BaseIO, tm
 
@@ -127,4 +127,67 @@ class HDF(BaseIO):
         self.df.to_hdf(self.fname, "df", format=format)
 
 
+class HDFStoreSelectThreads(BaseIO):
+
+    params = [1, 4]
+    param_names = ["threads"]
+
+    def setup(self, threads):
+        self.fname = "__test__.h5"
+        N = 500000
+        self.df = DataFrame(
+            {
+                "float": np.random.randn(N),
+                "int": np.random.randint(0, N, size=N),
+                "date": date_range("20000101", periods=N, freq="s"),
+                "string": tm.makeStringIndex(N),
+            },
+            index=date_range("20000101", periods=N, freq="H"),
+        )
+        self.df.to_hdf(
+            self.fname,
+            "df",
+            format="table",
+            data_columns=["float", "date"],
+            complib="blosc",
+            complevel=5,
+        )
+        self.store = HDFStore(self.fname, mode="r")
+
+    def teardown(self, threads):
+        self.store.close()
+        self.remove(self.fname)
+
+    def time_select(self, threads):
+        with option_context("io.hdf.threads", threads):
+            self.store.select("df")
+
+    def time_select_where(self, threads):
+        with option_context("io.hdf.threads", threads):
+            self.store.select("df", where="float > 0")
+
+
+class HDFStoreQueryCache(BaseIO):
+
+    params = [0, 16]
+    param_names = ["coordinate_cache"]
+
+    def setup(self, coordinate_cache):
+        self.fname = "__test__.h5"
+        N = 1000000
+        df = DataFrame(
+            {"A": np.random.randn(N), "B": np.random.randint(0, 1000, size=N)}
+        )
+        df.to_hdf(self.fname, "df", format="table", data_columns=True, index=False)
+        self.store = HDFStore(self.fname, mode="r", coordinate_cache=coordinate_cache)
+        self.store.select("df", where="A > 2 & B < 100")
+
+    def teardown(self, coordinate_cache):
+        self.store.close()
+        self.remove(self.fname)
+
+    def time_select_repeated_where(self, coordinate_cache):
+        self.store.select("df", where="A > 2 & B < 100", columns=["A"])
+
+
 from ..pandas_vb_common import setup  # noqa: F401 isort:skip
@@ -1,6 +1,13 @@
 import numpy as np
 
-from pandas import DataFrame, concat, date_range, read_json, timedelta_range
+from pandas import (
+    DataFrame,
+    concat,
+    date_range,
+    json_normalize,
+    read_json,
+    timedelta_range,
+)
 
 from ..pandas_vb_common import BaseIO, tm
 
@@ -60,6 +67,84 @@ class ReadJSONLines(BaseIO):
         concat(read_json(self.fname, orient="records", lines=True, chunksize=25000))
 
 
+class ReadJSONLinesEngine(BaseIO):
+
+    fname = "__test_lines_engine__.json"
+    params = ["ujson", "pyarrow"]
+    param_names = ["engine"]
+
+    def setup(self, engine):
+        if engine == "pyarrow":
+            try:
+                import pyarrow.json  # noqa: F401
+            except ImportError:
+                raise NotImplementedError
+        N = 100000
+        df = DataFrame(
+            {
+                "int": np.arange(N),
+                "float": np.random.randn(N),
+                "str": tm.makeStringIndex(N),
+                "created_at": date_range("20000101", periods=N, freq="s"),
+            }
+        )
+        df.to_json(self.fname, orient="records", lines=True)
+
+    def time_read_json_lines(self, engine):
+        read_json(self.fname, lines=True, engine=engine)
+
+    def time_read_json_lines_dtype(self, engine):
+        read_json(
+            self.fname,
+            lines=True,
+            dtype={"int": "int32", "float": "float32"},
+            engine=engine,
+        )
+
+    def time_read_json_lines_concat(self, engine):
+        concat(read_json(self.fname, lines=True, chunksize=25000, engine=engine))
+
+
+class NormalizeJSON:
+
+    params = [None, 1]
+    param_names = ["max_level"]
+
+    def setup(self, max_level):
+        N = 100000
+        self.data = [
+            {
+                "id": i,
+                "name": {"first": "John", "last": "Doe", "alias": {"nick": "JD"}},
+                "fitness": {"height": 130, "weight": 60.5},
+                "tags": ["a", "b"],
+            }
+            for i in range(N)
+        ]
+        self.nested = [
+            {
+                "state": f"state_{i}",
+                "info": {"governor": "Rick Scott"},
+                "counties": [
+                    {"name": f"county_{j}", "population": {"total": j}}
+                    for j in range(10)
+                ],
+            }
+            for i in range(N // 10)
+        ]
+
+    def time_normalize(self, max_level):
+        json_normalize(self.data, max_level=max_level)
+
+    def time_normalize_record_path(self, max_level):
+        json_normalize(
+            self.nested,
+            "counties",
+            ["state", ["info", "governor"]],
+            max_level=max_level,
+        )
+
+
 class ToJSON(BaseIO):
 
     fname = "__test__.json"
@@ -12,6 +12,8 @@ class SAS:
         # Read files that are located in 'pandas/tests/io/sas/data'
         files = {"sas7bdat": "test1.sas7bdat", "xport": "paxraw_d_short.xpt"}
         file = files[format]
+        columns = {"sas7bdat": ["Column1", "Column2"], "xport": ["SEQN", "PAXCAL"]}
+        self.columns = columns[format]
         paths = [
             os.path.dirname(__file__),
             "..",
@@ -28,3 +30,6 @@ class SAS:
 
     def time_read_sas(self, format):
         read_sas(self.f, format=format)
+
+    def time_read_sas_columns(self, format):
+        read_sas(self.f, format=format, columns=self.columns)
@@ -5,6 +5,8 @@ from sqlalchemy import create_engine
 
 from pandas import DataFrame, date_range, read_sql_query, read_sql_table
 
+from pandas.io.sql import SQLiteDatabase, SQLiteTable
+
 from ..pandas_vb_common import tm
 
 
@@ -83,6 +85,31 @@ class WriteSQLDtypes:
         read_sql_query(self.query_col, self.con)
 
 
+class InsertData:
+
+    params = ["float", "float_with_nan", "string", "bool", "int", "datetime"]
+    param_names = ["dtype"]
+
+    def setup(self, dtype):
+        N = 100000
+        df = DataFrame(
+            {
+                "float": np.random.randn(N),
+                "float_with_nan": np.random.randn(N),
+                "string": ["foo"] * N,
+                "bool": [True] * N,
+                "int": np.random.randint(0, N, size=N),
+                "datetime": date_range("2000-01-01", periods=N, freq="s"),
+            }
+        )
+        df.loc[1000:3000, "float_with_nan"] = np.nan
+        pandas_sql = SQLiteDatabase(sqlite3.connect(":memory:"))
+        self.table = SQLiteTable("test1", pandas_sql, frame=df[[dtype]])
+
+    def time_insert_data(self, dtype):
+        self.table.insert_data()
+
+
 class ReadSQLTable:
     def setup(self):
         N = 10000
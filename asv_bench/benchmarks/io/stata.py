@@ -50,4 +50,27 @@ class StataMissing(Stata):
         self.df.to_stata(self.fname, self.convert_dates)
 
 
+class StataCategoricalChunks(BaseIO):
+    def setup(self):
+        self.fname = "__test__.dta"
+        N = 100000
+        self.df = DataFrame(
+            {
+                "cat": np.random.choice(["a", "b", "c", "d"], N),
+                "value": np.random.randn(N),
+                "text": tm.makeStringIndex(N),
+            }
+        )
+        self.df["cat"] = self.df["cat"].astype("category")
+        self.df.to_stata(self.fname, write_index=False, version=117)
+
+    def time_read_stata_chunks(self):
+        with read_stata(self.fname, chunksize=10000) as reader:
+            for chunk in reader:
+                pass
+
+    def time_read_stata_columns(self):
+        read_stata(self.fname, columns=["cat", "value"])
+
+
 from ..pandas_vb_common import setup  # noqa: F401 isort:skip
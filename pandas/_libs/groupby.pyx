@@ -2,7 +2,10 @@ import cython
 from cython import Py_ssize_t
 from cython cimport floating
 
-from libc.stdlib cimport malloc, free
+from libc.math cimport asin, ldexp, log, sin, M_PI
+from libc.stdlib cimport malloc, free, qsort
+from libc.stdint cimport INT64_MAX, INT64_MIN, UINT64_MAX
+from libc.string cimport memcpy
 
 import numpy as np
 cimport numpy as cnp
@@ -79,12 +82,12 @@ cdef inline float64_t median_linear(float64_t* a, int n) nogil:
 
 
 # TODO: Is this redundant with algos.kth_smallest
-cdef inline float64_t kth_smallest_c(float64_t* a,
-                                     Py_ssize_t k,
-                                     Py_ssize_t n) nogil:
+cdef inline numeric kth_smallest_c(numeric* a,
+                                   Py_ssize_t k,
+                                   Py_ssize_t n) nogil:
     cdef:
         Py_ssize_t i, j, l, m
-        float64_t x, t
+        numeric x
 
     l = 0
     m = n - 1
@@ -154,7 +157,9 @@ def group_cumprod_float64(float64_t[:, :] out,
                           const int64_t[:] labels,
                           int ngroups,
                           bint is_datetimelike,
-                          bint skipna=True):
+                          bint skipna=True,
+                          const uint8_t[:, :] mask=None,
+                          uint8_t[:, :] result_mask=None):
     """
     Cumulative product of columns of `values`, in row groups `labels`.
 
@@ -172,6 +177,10 @@ def group_cumprod_float64(float64_t[:, :] out,
         Always false, `values` is never datetime-like.
     skipna : bool
         If true, ignore nans in `values`.
+    mask : uint8 array, optional
+        Missing values of `values`, which then are not checked for NaN.
+    result_mask : uint8 array, optional
+        Array to store the missing values of `out` in, required with `mask`.
 
     Notes
     -----
@@ -181,10 +190,14 @@ def group_cumprod_float64(float64_t[:, :] out,
         Py_ssize_t i, j, N, K, size
         float64_t val
         float64_t[:, :] accum
+        uint8_t[:, :] na_seen
         int64_t lab
+        bint uses_mask = mask is not None
 
     N, K = (<object>values).shape
     accum = np.ones((ngroups, K), dtype=np.float64)
+    if uses_mask:
+        na_seen = np.zeros((ngroups, K), dtype=np.uint8)
 
     with nogil:
         for i in range(N):
@@ -194,7 +207,15 @@ def group_cumprod_float64(float64_t[:, :] out,
                 continue
             for j in range(K):
                 val = values[i, j]
-                if val == val:
+                if uses_mask:
+                    if mask[i, j] or na_seen[lab, j]:
+                        result_mask[i, j] = 1
+                        if not skipna:
+                            na_seen[lab, j] = 1
+                    else:
+                        accum[lab, j] *= val
+                        out[i, j] = accum[lab, j]
+                elif val == val:
                     accum[lab, j] *= val
                     out[i, j] = accum[lab, j]
                 else:
@@ -204,6 +225,104 @@ def group_cumprod_float64(float64_t[:, :] out,
                         break
 
 
+ctypedef fused cumprod_int_t:
+    int64_t
+    uint64_t
+
+
+@cython.cdivision(True)
+cdef inline bint _mul_overflows(cumprod_int_t a, cumprod_int_t b) nogil:
+    """
+    Whether the product of `a` and `b` does not fit in their type.
+    """
+    if cumprod_int_t is uint64_t:
+        return b != 0 and a > UINT64_MAX / b
+    else:
+        if a > 0:
+            if b > 0:
+                return a > INT64_MAX / b
+            return b < INT64_MIN / a
+        if b > 0:
+            return a < INT64_MIN / b
+        return a != 0 and b < INT64_MAX / a
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_masked(cumprod_int_t[:, :] out,
+                         const cumprod_int_t[:, :] values,
+                         const int64_t[:] labels,
+                         int ngroups,
+                         bint is_datetimelike,
+                         const uint8_t[:, :] mask,
+                         uint8_t[:, :] result_mask,
+                         bint skipna=True):
+    """
+    Cumulative product of columns of integer `values` with missing values
+    `mask`, in row groups `labels`, raising if a product overflows.
+
+    Parameters
+    ----------
+    out : int64 or uint64 array
+        Array to store cumprod in.
+    values : int64 or uint64 array
+        Values to take cumprod of.
+    labels : int64 array
+        Labels to group by.
+    ngroups : int
+        Number of groups, larger than all entries of `labels`.
+    is_datetimelike : bool
+        Always false, `values` is never datetime-like.
+    mask : uint8 array
+        Missing values of `values`.
+    result_mask : uint8 array
+        Array to store the missing values of `out` in.
+    skipna : bool
+        If true, ignore the missing values of `values`.
+
+    Notes
+    -----
+    This method modifies the `out` parameter, rather than returning an object.
+    """
+    cdef:
+        Py_ssize_t i, j, N, K
+        cumprod_int_t val
+        cumprod_int_t[:, :] accum
+        uint8_t[:, :] na_seen
+        int64_t lab
+        bint overflow = False
+
+    N, K = (<object>values).shape
+    accum = np.ones((ngroups, K), dtype=np.asarray(values).dtype)
+    na_seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+
+            if lab < 0:
+                continue
+            for j in range(K):
+                if mask[i, j] or na_seen[lab, j]:
+                    result_mask[i, j] = 1
+                    if not skipna:
+                        na_seen[lab, j] = 1
+                    continue
+                val = values[i, j]
+                if _mul_overflows(accum[lab, j], val):
+                    overflow = True
+                    break
+                accum[lab, j] *= val
+                out[i, j] = accum[lab, j]
+            if overflow:
+                break
+
+    if overflow:
+        raise OverflowError(
+            f"Overflow in {np.asarray(values).dtype} multiplication"
+        )
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def group_cumsum(numeric[:, :] out,
@@ -211,7 +330,9 @@ def group_cumsum(numeric[:, :] out,
                  const int64_t[:] labels,
                  int ngroups,
                  is_datetimelike,
-                 bint skipna=True):
+                 bint skipna=True,
+                 const uint8_t[:, :] mask=None,
+                 uint8_t[:, :] result_mask=None):
     """
     Cumulative sum of columns of `values`, in row groups `labels`.
 
@@ -229,6 +350,10 @@ def group_cumsum(numeric[:, :] out,
         True if `values` contains datetime-like entries.
     skipna : bool
         If true, ignore nans in `values`.
+    mask : uint8 array, optional
+        Missing values of `values`, which then are not checked for NaN.
+    result_mask : uint8 array, optional
+        Array to store the missing values of `out` in, required with `mask`.
 
     Notes
     -----
@@ -238,10 +363,14 @@ def group_cumsum(numeric[:, :] out,
         Py_ssize_t i, j, N, K, size
         numeric val
         numeric[:, :] accum
+        uint8_t[:, :] na_seen
         int64_t lab
+        bint uses_mask = mask is not None
 
     N, K = (<object>values).shape
     accum = np.zeros((ngroups, K), dtype=np.asarray(values).dtype)
+    if uses_mask:
+        na_seen = np.zeros((ngroups, K), dtype=np.uint8)
 
     with nogil:
         for i in range(N):
@@ -252,7 +381,15 @@ def group_cumsum(numeric[:, :] out,
             for j in range(K):
                 val = values[i, j]
 
-                if numeric == float32_t or numeric == float64_t:
+                if uses_mask:
+                    if mask[i, j] or na_seen[lab, j]:
+                        result_mask[i, j] = 1
+                        if not skipna:
+                            na_seen[lab, j] = 1
+                    else:
+                        accum[lab, j] += val
+                        out[i, j] = accum[lab, j]
+                elif numeric == float32_t or numeric == float64_t:
                     if val == val:
                         accum[lab, j] += val
                         out[i, j] = accum[lab, j]
@@ -1382,7 +1519,8 @@ def group_cummin(groupby_t[:, :] out,
                  groupby_t[:, :] values,
                  const int64_t[:] labels,
                  int ngroups,
-                 bint is_datetimelike):
+                 bint is_datetimelike,
+                 const uint8_t[:, :] mask=None):
     """
     Cumulative minimum of columns of `values`, in row groups `labels`.
 
@@ -1398,6 +1536,9 @@ def group_cummin(groupby_t[:, :] out,
         Number of groups, larger than all entries of `labels`.
     is_datetimelike : bool
         True if `values` contains datetime-like entries.
+    mask : uint8 array, optional
+        Missing values of `values`, which then are not checked for NaN. The
+        missing values of `out` are the same.
 
     Notes
     -----
@@ -1408,6 +1549,7 @@ def group_cummin(groupby_t[:, :] out,
         groupby_t val, mval
         ndarray[groupby_t, ndim=2] accum
         int64_t lab
+        bint uses_mask = mask is not None
 
     N, K = (<object>values).shape
     accum = np.empty((ngroups, K), dtype=np.asarray(values).dtype)
@@ -1427,7 +1569,9 @@ def group_cummin(groupby_t[:, :] out,
             for j in range(K):
                 val = values[i, j]
 
-                if _treat_as_na(val, is_datetimelike):
+                if uses_mask and mask[i, j]:
+                    out[i, j] = val
+                elif not uses_mask and _treat_as_na(val, is_datetimelike):
                     out[i, j] = val
                 else:
                     mval = accum[lab, j]
@@ -1442,7 +1586,8 @@ def group_cummax(groupby_t[:, :] out,
                  groupby_t[:, :] values,
                  const int64_t[:] labels,
                  int ngroups,
-                 bint is_datetimelike):
+                 bint is_datetimelike,
+                 const uint8_t[:, :] mask=None):
     """
     Cumulative maximum of columns of `values`, in row groups `labels`.
 
@@ -1458,6 +1603,9 @@ def group_cummax(groupby_t[:, :] out,
         Number of groups, larger than all entries of `labels`.
     is_datetimelike : bool
         True if `values` contains datetime-like entries.
+    mask : uint8 array, optional
+        Missing values of `values`, which then are not checked for NaN. The
+        missing values of `out` are the same.
 
     Notes
     -----
@@ -1468,6 +1616,7 @@ def group_cummax(groupby_t[:, :] out,
         groupby_t val, mval
         ndarray[groupby_t, ndim=2] accum
         int64_t lab
+        bint uses_mask = mask is not None
 
     N, K = (<object>values).shape
     accum = np.empty((ngroups, K), dtype=np.asarray(values).dtype)
@@ -1487,10 +1636,507 @@ def group_cummax(groupby_t[:, :] out,
             for j in range(K):
                 val = values[i, j]
 
-                if _treat_as_na(val, is_datetimelike):
+                if uses_mask and mask[i, j]:
+                    out[i, j] = val
+                elif not uses_mask and _treat_as_na(val, is_datetimelike):
                     out[i, j] = val
                 else:
                     mval = accum[lab, j]
                     if val > mval:
                         accum[lab, j] = mval = val
                     out[i, j] = mval
+
+
+# ----------------------------------------------------------------------
+# group_select_n, group_head
+# ----------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_select_n(uint8_t[:] out,
+                   groupby_t[:] values,
+                   const int64_t[:] labels,
+                   Py_ssize_t ngroups,
+                   Py_ssize_t n,
+                   bint keep_all=False):
+    """
+    Mark the `n` smallest values of each group.
+
+    Parameters
+    ----------
+    out : array of uint8_t values which this method will write its results to
+        1 for the selected rows, 0 otherwise
+    values : array containing the values to select, smallest first
+    labels : array containing unique label for each group, with its ordering
+        matching up to the corresponding record in `values`. Rows with a
+        missing value must be given the label -1.
+    ngroups : int
+        Number of groups, larger than all entries of `labels`
+    n : int
+        Number of values to select per group
+    keep_all : bool, default False
+        Whether to also select all values tied with the n-th smallest one
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    Each group is visited once as a contiguous slice of the group-sorted
+    values and selected with a linear-time partition. Ties are resolved in
+    favour of the row coming first, reverse the inputs to prefer the last.
+    """
+    cdef:
+        Py_ssize_t i, j, N, start, size, remaining
+        int64_t max_size
+        ndarray[int64_t] indexer, counts
+        ndarray[groupby_t] sorted_values, buf
+        groupby_t kth
+        groupby_t* sorted_ptr
+        groupby_t* buf_ptr
+
+    N = len(labels)
+    out[:] = 0
+
+    if n <= 0 or N == 0:
+        return
+
+    indexer, counts = groupsort_indexer(labels, ngroups)
+    max_size = counts[1:].max() if ngroups > 0 else 0
+    sorted_values = np.asarray(values).take(indexer)
+    buf = np.empty(max_size, dtype=sorted_values.dtype)
+    sorted_ptr = <groupby_t*>cnp.PyArray_DATA(sorted_values)
+    buf_ptr = <groupby_t*>cnp.PyArray_DATA(buf)
+
+    with nogil:
+        # skip the NA group
+        start = counts[0]
+        for j in range(ngroups):
+            size = counts[j + 1]
+
+            if size <= n:
+                for i in range(start, start + size):
+                    out[indexer[i]] = 1
+            else:
+                memcpy(buf_ptr, sorted_ptr + start, size * sizeof(groupby_t))
+                kth = kth_smallest_c(buf_ptr, n - 1, size)
+
+                remaining = n
+                for i in range(start, start + size):
+                    if sorted_values[i] < kth:
+                        remaining -= 1
+
+                # the slice keeps the original order within the group,
+                # so the first ties seen are the ones to keep
+                for i in range(start, start + size):
+                    if sorted_values[i] < kth:
+                        out[indexer[i]] = 1
+                    elif sorted_values[i] == kth:
+                        if keep_all or remaining > 0:
+                            out[indexer[i]] = 1
+                            remaining -= 1
+
+            start += size
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_head(uint8_t[:] out,
+               const int64_t[:] labels,
+               Py_ssize_t ngroups,
+               Py_ssize_t n,
+               bint from_end=False):
+    """
+    Mark the first (or last) `n` rows of each group.
+
+    Parameters
+    ----------
+    out : array of uint8_t values which this method will write its results to
+        1 for the selected rows, 0 otherwise
+    labels : array containing unique label for each group, with its ordering
+        matching up to the corresponding record in `values`. Rows labelled -1
+        are counted as a group of their own.
+    ngroups : int
+        Number of groups, larger than all entries of `labels`
+    n : int
+        Number of rows to select per group
+    from_end : bool, default False
+        Whether to select the last rows of each group instead of the first
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    """
+    cdef:
+        Py_ssize_t i, ii, N = len(labels), offset = 0, sign = 1
+        int64_t lab
+        int64_t[:] seen = np.zeros(ngroups + 1, dtype=np.int64)
+
+    if from_end:
+        offset = N - 1
+        sign = -1
+
+    with nogil:
+        for i in range(N):
+            ii = offset + sign * i
+            lab = labels[ii]
+            if lab < 0:
+                lab = ngroups
+
+            seen[lab] += 1
+            out[ii] = seen[lab] <= n
+
+
+# ----------------------------------------------------------------------
+# Approximate aggregations: group_hll, group_tdigest
+# ----------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_hll(uint8_t[:, :] out,
+              const uint64_t[:] hashes,
+              const int64_t[:] labels):
+    """
+    Update the HyperLogLog registers of each group with hashed values.
+
+    Parameters
+    ----------
+    out : array of uint8_t registers of shape (ngroups, 2 ** precision),
+        updated in place
+    hashes : array containing the 64-bit hash of each value
+    labels : array containing unique label for each group, with its ordering
+        matching up to the corresponding record in `hashes`. Missing values
+        must be given the label -1.
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    The leading `precision` bits of a hash select the register, which keeps
+    the largest position of the leftmost 1-bit seen in the remaining bits.
+    """
+    cdef:
+        Py_ssize_t i, N = len(labels), m = out.shape[1]
+        int precision = 0
+        uint8_t rank, max_rank
+        int64_t lab
+        uint64_t h, w, idx, top_bit = (<uint64_t>1) << 63
+
+    while ((<Py_ssize_t>1) << precision) < m:
+        precision += 1
+    if ((<Py_ssize_t>1) << precision) != m or not 4 <= precision <= 18:
+        raise ValueError("number of registers must be a power of 2 "
+                         "between 2 ** 4 and 2 ** 18")
+
+    max_rank = 64 - precision + 1
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            h = hashes[i]
+            idx = h >> (64 - precision)
+            w = h << precision
+            rank = 1
+            while rank < max_rank and not (w & top_bit):
+                w <<= 1
+                rank += 1
+
+            if rank > out[lab, idx]:
+                out[lab, idx] = rank
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def hll_estimate(float64_t[:] out, const uint8_t[:, :] registers):
+    """
+    Estimate the number of distinct values of each group from its
+    HyperLogLog registers.
+
+    Parameters
+    ----------
+    out : array of float64_t values which this method will write its results to
+    registers : array of uint8_t registers of shape (ngroups, 2 ** precision)
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    Small cardinalities are estimated by linear counting of empty registers.
+    """
+    cdef:
+        Py_ssize_t i, j, zeros, ngroups = registers.shape[0]
+        Py_ssize_t m = registers.shape[1]
+        float64_t alpha, total, estimate
+
+    if m == 16:
+        alpha = 0.673
+    elif m == 32:
+        alpha = 0.697
+    elif m == 64:
+        alpha = 0.709
+    else:
+        alpha = 0.7213 / (1 + 1.079 / m)
+
+    with nogil:
+        for i in range(ngroups):
+            total = 0
+            zeros = 0
+            for j in range(m):
+                total += ldexp(1.0, -registers[i, j])
+                if registers[i, j] == 0:
+                    zeros += 1
+
+            estimate = alpha * m * m / total
+            if estimate <= 2.5 * m and zeros > 0:
+                estimate = m * log(<float64_t>m / zeros)
+            out[i] = estimate
+
+
+cdef int _compare_float64(const void* a, const void* b) nogil:
+    cdef:
+        float64_t x = (<float64_t*>a)[0]
+        float64_t y = (<float64_t*>b)[0]
+    return (x > y) - (x < y)
+
+
+cdef inline float64_t _tdigest_q_limit(float64_t q, float64_t compression) nogil:
+    """
+    Largest quantile a centroid starting at `q` may reach, using the
+    scale function k(q) = compression / (2 pi) * asin(2q - 1).
+    """
+    cdef:
+        float64_t k = compression / (2 * M_PI) * asin(2 * q - 1) + 1
+
+    if k >= compression / 4:
+        return 1.0
+    return (sin(2 * M_PI * k / compression) + 1) / 2
+
+
+cdef Py_ssize_t _tdigest_compress(float64_t* means,
+                                  float64_t* weights,
+                                  Py_ssize_t n,
+                                  float64_t compression) nogil:
+    """
+    Merge adjacent centroids, sorted by mean, in place.
+
+    Returns the number of centroids left, which is at most compression + 3.
+    """
+    cdef:
+        Py_ssize_t i, j = 0
+        float64_t total = 0, so_far = 0, q_limit
+
+    if n <= 1:
+        return n
+
+    for i in range(n):
+        total += weights[i]
+
+    q_limit = _tdigest_q_limit(0, compression)
+    for i in range(1, n):
+        if (so_far + weights[j] + weights[i]) / total <= q_limit:
+            weights[j] += weights[i]
+            means[j] += weights[i] * (means[i] - means[j]) / weights[j]
+        else:
+            so_far += weights[j]
+            q_limit = _tdigest_q_limit(so_far / total, compression)
+            j += 1
+            means[j] = means[i]
+            weights[j] = weights[i]
+
+    return j + 1
+
+
+def tdigest_compress(float64_t[:] means,
+                     float64_t[:] weights,
+                     float64_t compression) -> Py_ssize_t:
+    """
+    Merge adjacent t-digest centroids, sorted by mean, in place.
+
+    Returns
+    -------
+    int
+        The number of centroids left at the front of `means` and `weights`.
+    """
+    if len(means) == 0:
+        return 0
+    return _tdigest_compress(&means[0], &weights[0], len(means), compression)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_tdigest(float64_t[:, :] means,
+                  float64_t[:, :] weights,
+                  int64_t[:] counts,
+                  float64_t[:] mins,
+                  float64_t[:] maxs,
+                  const float64_t[:] values,
+                  const int64_t[:] labels,
+                  float64_t compression):
+    """
+    Build a t-digest of the values of each group.
+
+    Parameters
+    ----------
+    means : array of float64_t of shape (ngroups, capacity) which this method
+        will write the centroid means to, capacity must be at least
+        ``int(compression) + 4``
+    weights : array of float64_t of shape (ngroups, capacity) which this
+        method will write the centroid weights to
+    counts : array of int64_t which this method will write the number of
+        centroids of each group to
+    mins : array of float64_t which this method will write the minimum of each
+        group to
+    maxs : array of float64_t which this method will write the maximum of each
+        group to
+    values : array containing the values to sketch, missing values are skipped
+    labels : array containing unique label for each group, with its ordering
+        matching up to the corresponding record in `values`
+    compression : float
+        Accuracy parameter of the digest, bounding the number of centroids
+
+    Notes
+    -----
+    This method modifies the output parameters rather than returning an object.
+    Each group is visited once as a contiguous slice of the group-sorted
+    values. The slice is consumed in blocks which are sorted and merged into
+    the group's centroids, so no group is ever sorted as a whole.
+    """
+    cdef:
+        Py_ssize_t i, j, k, start, end, n, nbuf, ia, ib
+        Py_ssize_t ngroups = len(counts), capacity = means.shape[1]
+        Py_ssize_t block = 4 * capacity
+        float64_t val
+        ndarray[int64_t] indexer, group_counts
+        ndarray[float64_t] buf, merged_means, merged_weights
+
+    if compression < 1:
+        raise ValueError("compression must be at least 1")
+    if capacity < <Py_ssize_t>compression + 4:
+        raise ValueError("capacity must be at least int(compression) + 4")
+
+    indexer, group_counts = groupsort_indexer(labels, ngroups)
+    buf = np.empty(block, dtype=np.float64)
+    merged_means = np.empty(capacity + block, dtype=np.float64)
+    merged_weights = np.empty(capacity + block, dtype=np.float64)
+
+    counts[:] = 0
+    mins[:] = NaN
+    maxs[:] = NaN
+
+    with nogil:
+        # skip the NA group
+        start = group_counts[0]
+        for j in range(ngroups):
+            end = start + group_counts[j + 1]
+
+            while start < end:
+                # sort the next block of non-missing values
+                nbuf = 0
+                while start < end and nbuf < block:
+                    val = values[indexer[start]]
+                    start += 1
+                    if val == val:
+                        buf[nbuf] = val
+                        nbuf += 1
+
+                if nbuf == 0:
+                    continue
+                qsort(&buf[0], nbuf, sizeof(float64_t), _compare_float64)
+
+                if counts[j] == 0 or buf[0] < mins[j]:
+                    mins[j] = buf[0]
+                if counts[j] == 0 or buf[nbuf - 1] > maxs[j]:
+                    maxs[j] = buf[nbuf - 1]
+
+                # merge the block into the centroids, both sorted by mean
+                n = counts[j]
+                ia = ib = k = 0
+                while ia < n or ib < nbuf:
+                    if ib == nbuf or (ia < n and means[j, ia] <= buf[ib]):
+                        merged_means[k] = means[j, ia]
+                        merged_weights[k] = weights[j, ia]
+                        ia += 1
+                    else:
+                        merged_means[k] = buf[ib]
+                        merged_weights[k] = 1
+                        ib += 1
+                    k += 1
+
+                n = _tdigest_compress(&merged_means[0], &merged_weights[0],
+                                      k, compression)
+                for k in range(n):
+                    means[j, k] = merged_means[k]
+                    weights[j, k] = merged_weights[k]
+                counts[j] = n
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_tdigest_quantile(float64_t[:] out,
+                           const float64_t[:, :] means,
+                           const float64_t[:, :] weights,
+                           const int64_t[:] counts,
+                           const float64_t[:] mins,
+                           const float64_t[:] maxs,
+                           float64_t q):
+    """
+    Estimate the `q` quantile of each group from its t-digest.
+
+    Parameters
+    ----------
+    out : array of float64_t values which this method will write its results to
+    means, weights, counts, mins, maxs : t-digest of each group, as computed by
+        group_tdigest
+    q : float
+        The quantile to estimate, between 0 and 1
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object.
+    A centroid of weight w is taken to cover w consecutive ranks and placed at
+    their center, with the minimum and maximum at the first and last rank.
+    Values in between are linearly interpolated, so that digests of distinct
+    values give the same results as ``numpy.percentile``.
+    """
+    cdef:
+        Py_ssize_t i, j, n, ngroups = len(counts)
+        float64_t total, target, before, pos, prev_pos, prev_mean
+
+    if not 0 <= q <= 1:
+        raise ValueError(f"'q' must be between 0 and 1. Got '{q}' instead")
+
+    with nogil:
+        for i in range(ngroups):
+            n = counts[i]
+            if n == 0:
+                out[i] = NaN
+                continue
+
+            total = 0
+            for j in range(n):
+                total += weights[i, j]
+            target = q * (total - 1)
+
+            # the minimum is the centroid at rank 0
+            prev_pos = 0
+            prev_mean = mins[i]
+            before = 0
+            out[i] = maxs[i]
+            for j in range(n):
+                pos = before + (weights[i, j] - 1) / 2
+                if target <= pos:
+                    if pos == prev_pos:
+                        out[i] = means[i, j]
+                    else:
+                        out[i] = prev_mean + (means[i, j] - prev_mean) * (
+                            (target - prev_pos) / (pos - prev_pos))
+                    break
+                prev_pos = pos
+                prev_mean = means[i, j]
+                before += weights[i, j]
+            else:
+                # beyond the last centroid, up to the maximum at the last rank
+                pos = total - 1
+                if pos > prev_pos:
+                    out[i] = prev_mean + (maxs[i] - prev_mean) * (
+                        (target - prev_pos) / (pos - prev_pos))
+
@@ -400,6 +400,102 @@ def dicts_to_array(dicts: list, columns: list):
     return result
 
 
+cdef inline void _add_record_value(object key, object value, Py_ssize_t i,
+                                   dict positions, list keys, list columns):
+    # set the value of the key in row i of the column of the key, filling the
+    # rows without it with NaN
+    cdef:
+        list column
+        object position = positions.get(key)
+
+    if position is None:
+        positions[key] = len(columns)
+        keys.append(key)
+        column = [np.nan] * i
+        columns.append(column)
+    else:
+        column = columns[position]
+        if len(column) == i + 1:
+            # the same key at different levels, the last one is kept
+            column[i] = value
+            return
+        if len(column) < i:
+            column.extend([np.nan] * (i - len(column)))
+    column.append(value)
+
+
+cdef _flatten_record_values(dict record, str prefix, str sep, int level,
+                            int max_level, Py_ssize_t i, dict positions,
+                            list keys, list columns):
+    cdef:
+        object key, value
+        str new_key
+
+    for key, value in record.items():
+        new_key = prefix + sep + str(key)
+        if isinstance(value, dict) and (max_level < 0 or level < max_level):
+            _flatten_record_values(value, new_key, sep, level + 1, max_level,
+                                   i, positions, keys, columns)
+        else:
+            _add_record_value(new_key, value, i, positions, keys, columns)
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def flatten_records(list records, str sep=".", int max_level=-1):
+    """
+    Flatten nested dicts into columns of values, in one pass over the records.
+
+    The keys of nested dicts are joined with `sep` to the key of the dict
+    containing them, as in ``json_normalize``, and the columns are in the
+    order of the keys of the records flattened by ``nested_to_record``.
+
+    Parameters
+    ----------
+    records : list of dict
+    sep : str, default '.'
+    max_level : int, default -1
+        Max depth of the dicts to flatten, -1 to flatten all.
+
+    Returns
+    -------
+    keys : list
+    columns : list of ndarray[object]
+        Values of each key, NaN for records without it.
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(records)
+        dict record, positions = {}
+        list keys = [], columns = [], nested, column
+        object key, value
+        ndarray[object] result
+        int flatten_top = max_level != 0
+
+    for i in range(n):
+        record = records[i]
+        nested = []
+        # values of the record which are not flattened keep their key and
+        # come first, as in nested_to_record
+        for key, value in record.items():
+            if flatten_top and isinstance(value, dict):
+                nested.append((key, value))
+            else:
+                _add_record_value(key, value, i, positions, keys, columns)
+        for key, value in nested:
+            _flatten_record_values(value, str(key), sep, 1, max_level, i,
+                                   positions, keys, columns)
+
+    arrays = []
+    for column in columns:
+        result = np.empty(n, dtype=object)
+        for j in range(len(column)):
+            result[j] = column[j]
+        for j in range(len(column), n):
+            result[j] = np.nan
+        arrays.append(result)
+    return keys, arrays
+
+
 def fast_zip(list ndarrays):
     """
     For zipping multiple ndarrays into an ndarray of tuples.